@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+_push_core.py — shared Git push logic, parameterised by target repo.
+
+push.py stays a thin shim over main(), so per-book copies of the push
+script can reuse this module instead of carrying their own copy of the
+logic.
+
+What main() does:
+  1) Finds repo root (via .git)
+  2) Ensures remote 'origin' is set to the target repo
+  3) Detects remote default branch (main/master/etc.)
+  4) Adds all changes, commits if needed
+  5) Pushes to origin default branch (no force)
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+
+# Skip the fetch if one completed this recently (seconds)
+FETCH_TTL = 60
+
+
+def run(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
+    print(f"→ {' '.join(cmd)}")
+    return subprocess.run(cmd, check=check)
+
+
+def capture(cmd: list[str]) -> str:
+    out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+    return out.strip()
+
+
+def find_repo_root(start: str) -> Path:
+    # Plain dirname/exists string walk; only the found root becomes a Path.
+    p = start
+    while True:
+        if os.path.exists(os.path.join(p, ".git")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            raise RuntimeError("Could not find repo root (.git not found). Put push.py in the repo root.")
+        p = parent
+
+
+def ensure_origin(target_url: str) -> None:
+    try:
+        current = capture(["git", "remote", "get-url", "origin"])
+        if current != target_url:
+            print(f"! origin is set to:\n  {current}\n! changing to:\n  {target_url}")
+            run(["git", "remote", "set-url", "origin", target_url])
+        else:
+            print(f"✓ origin already set to {target_url}")
+    except subprocess.CalledProcessError:
+        print(f"! origin not found. Adding origin -> {target_url}")
+        run(["git", "remote", "add", "origin", target_url])
+
+
+def detect_remote_default_branch() -> str:
+    """
+    Prefer: parse `ls-remote --symref origin HEAD` — one call that works even
+    when refs/remotes/origin/HEAD was never set locally.
+    Fallback: main, then master, then current branch.
+    """
+    # git touches .git/FETCH_HEAD on every fetch; if one just ran (say a
+    # quick rerun after a failed push), the refs can't be stale enough to
+    # matter, so spare the network round trip.
+    try:
+        fresh = time.time() - os.path.getmtime(".git/FETCH_HEAD") < FETCH_TTL
+    except OSError:
+        fresh = False
+    if fresh:
+        print("✓ Recently fetched; skipping fetch")
+    else:
+        run(["git", "fetch", "origin", "--prune"], check=False)
+
+    try:
+        out = capture(["git", "ls-remote", "--symref", "origin", "HEAD"])
+        for line in out.splitlines():
+            # "ref: refs/heads/<branch>\tHEAD"
+            if line.startswith("ref:"):
+                return line.split()[1].rsplit("/", 1)[-1]
+    except subprocess.CalledProcessError:
+        pass
+
+    branches = capture(["git", "branch", "-r"])
+    if "origin/main" in branches:
+        return "main"
+    if "origin/master" in branches:
+        return "master"
+    current = capture(["git", "branch", "--show-current"])
+    return current or "main"
+
+
+def ensure_local_branch(branch: str) -> None:
+    current = capture(["git", "branch", "--show-current"])
+    if current == branch:
+        return
+
+    locals_ = capture(["git", "branch", "--list", branch])
+    if locals_.strip():
+        run(["git", "checkout", branch])
+        return
+
+    remotes = capture(["git", "branch", "-r"])
+    if f"origin/{branch}" in remotes:
+        run(["git", "checkout", "-b", branch, f"origin/{branch}"])
+    else:
+        run(["git", "checkout", "-b", branch])
+
+
+def commit_if_needed(message: str) -> None:
+    # Check status first: on a clean tree (the common rerun case) this
+    # skips the `git add .` walk of the whole working copy.
+    status = capture(["git", "status", "--porcelain"])
+    if not status:
+        print("✓ No changes to commit")
+        return
+    run(["git", "add", "."])
+    run(["git", "commit", "-m", message], check=True)
+
+
+def push(branch: str) -> None:
+    run(["git", "push", "-u", "origin", branch], check=True)
+
+
+def main(target_owner: str, target_repo: str, message: str = "sync") -> int:
+    # HTTPS (works with Git Credential Manager on Windows)
+    target_origin = f"https://github.com/{target_owner}/{target_repo}.git"
+    # SSH variant: f"git@github.com:{target_owner}/{target_repo}.git"
+
+    repo_root = find_repo_root(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(repo_root)
+    print(f"Repo root: {repo_root}")
+
+    ensure_origin(target_origin)
+
+    default_branch = detect_remote_default_branch()
+    print(f"Remote default branch: {default_branch}")
+
+    ensure_local_branch(default_branch)
+
+    commit_if_needed(message)
+    push(default_branch)
+
+    print("✓ Done")
+    return 0
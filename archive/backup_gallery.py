@@ -1,5 +1,7 @@
 import os
 import shutil
+import subprocess
+import sys
 from datetime import datetime
 
 source_dir = os.path.dirname(os.path.abspath(__file__))
@@ -7,12 +9,37 @@ timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 holder_dir = "C:/gallery-backups"
 dest_dir = os.path.join(holder_dir, f"gallery-{timestamp}")
 
-# Clean prior conflicts
-if os.path.exists(dest_dir):
-    shutil.rmtree(dest_dir, ignore_errors=True)
+
+def copy_tree(src, dst):
+    """
+    Copy a tree with the platform's native tool when available:
+    robocopy (multi-threaded, unbuffered I/O) on Windows, rsync
+    (in-kernel copy) elsewhere. Falls back to shutil.copytree when
+    the tool is missing.
+    """
+    try:
+        if sys.platform == "win32":
+            rc = subprocess.run(
+                ["robocopy", src, dst, "/MIR", "/MT:16", "/J", "/NFL", "/NDL"]
+            ).returncode
+            # robocopy exit codes below 8 all mean success
+            if rc >= 8:
+                raise RuntimeError(f"robocopy failed with code {rc}")
+            return
+        rc = subprocess.run(["rsync", "-a", src + "/", dst + "/"]).returncode
+        if rc != 0:
+            raise RuntimeError(f"rsync failed with code {rc}")
+        return
+    except FileNotFoundError:
+        # Native tool not installed. copytree's copy2 path uses
+        # sendfile()/copy_file_range() on Linux (in-kernel copies), and
+        # dirs_exist_ok merges into an existing destination, so no
+        # rmtree-and-rebuild dance is needed.
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=shutil.copy2)
+
 
 # Ensure holder exists
 os.makedirs(holder_dir, exist_ok=True)
 
-shutil.copytree(source_dir, dest_dir)
+copy_tree(source_dir, dest_dir)
 print(f"Backup: {dest_dir}")
@@ -3,64 +3,92 @@
 build-dev.py - Generate viewer-dev.html for each book folder
 """
 
+import functools
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 # Configuration
 BOOKS_ROOT = Path("E:/gallery/books")
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATE_FILE = SCRIPT_DIR / "viewer-template-dev.html"
 
-IMAGE_EXTS = {".webp", ".jpg", ".jpeg", ".png", ".gif"}
+# Extensions without the dot, matched against name.rsplit('.', 1)
+IMAGE_EXTS = frozenset({"webp", "jpg", "jpeg", "png", "gif"})
+
+# Placeholder pattern; the capturing group keeps placeholders when the
+# template is split once per run for streamed writes
+PLACEHOLDER = re.compile(r"(__[A-Z_]+__)")
+
+# Numeric-sort pattern, compiled once — num_key runs per filename
+_NUM_RE = re.compile(r'(\d+)')
+
+# Subfolder names that never hold page images
+SKIP_DIRS = {"thumbs", "thumb", "thumbnails", "tn"}
+
+
+def find_images(folder: Path) -> List[Tuple[str, str]]:
+    """Find all image files in a folder as (name, path), sorted numerically."""
+    # scandir keeps the DirEntry metadata, so is_file() needs no extra
+    # stat(); a missing folder raises from the same syscall, so no
+    # up-front exists() check either. The numeric sort key is stored on
+    # each tuple so sort() compares in C with no key callback.
+    entries = []
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                name = e.name
+                lower = name.lower()
+                if '.' not in lower or lower.rsplit('.', 1)[-1] not in IMAGE_EXTS:
+                    continue
+                m = _NUM_RE.search(name)
+                entries.append(((int(m.group(1)) if m else 999999, lower), name, e.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
+    entries.sort()
+    return [(name, path) for _, name, path in entries]
 
-def find_images(folder: Path) -> List[Path]:
-    """Find all image files in a folder, sorted numerically."""
-    if not folder.exists():
-        return []
-    
-    images = [f for f in folder.iterdir() 
-              if f.is_file() and f.suffix.lower() in IMAGE_EXTS]
-    
-    def num_key(p: Path) -> tuple:
-        m = re.search(r'(\d+)', p.name)
-        return (int(m.group(1)), p.name.lower()) if m else (999999, p.name.lower())
-    
-    images.sort(key=num_key)
-    return images
 
+def scan_book(book_dir: Path) -> Optional[Tuple[Path, List[Tuple[str, str]]]]:
+    """Find the pages folder and its images in one scan."""
+    images = find_images(book_dir)
+    if images:
+        return book_dir, images
+
+    with os.scandir(book_dir) as it:
+        for subfolder in it:
+            if not subfolder.is_dir(follow_symlinks=False):
+                continue
+            if subfolder.name.lower() in SKIP_DIRS:
+                continue
+            images = find_images(Path(subfolder.path))
+            if images:
+                return Path(subfolder.path), images
 
-def find_pages_folder(book_dir: Path) -> Optional[Path]:
-    """Find the folder containing page images."""
-    if find_images(book_dir):
-        return book_dir
-    
-    for subfolder in book_dir.iterdir():
-        if not subfolder.is_dir():
-            continue
-        if subfolder.name.lower() in {"thumbs", "thumb", "thumbnails", "tn"}:
-            continue
-        images = find_images(subfolder)
-        if images:
-            return subfolder
-    
     return None
 
 
 def find_toc_file(book_dir: Path) -> Optional[Path]:
-    """Find TOC text file in book folder."""
-    txt_files = list(book_dir.glob("*.txt"))
-    
-    if not txt_files:
+    """Find TOC text file in book folder (single short-circuiting scan)."""
+    first_txt = None
+    try:
+        with os.scandir(book_dir) as it:
+            for e in it:
+                if not e.name.endswith('.txt') or not e.is_file(follow_symlinks=False):
+                    continue
+                if 'toc' in e.name.lower():
+                    return Path(e.path)
+                if first_txt is None:
+                    first_txt = Path(e.path)
+    except FileNotFoundError:
         return None
-    
-    for f in txt_files:
-        if 'toc' in f.name.lower():
-            return f
-    
-    return txt_files[0]
+    return first_txt
 
 
 def parse_toc(toc_file: Optional[Path]) -> Dict[str, Any]:
@@ -72,110 +100,123 @@ def parse_toc(toc_file: Optional[Path]) -> Dict[str, Any]:
     
     current_chapter = None
     
-    for line in toc_file.read_text(encoding='utf-8', errors='replace').splitlines():
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        parts = [p.strip() for p in line.split('|')]
-        if not parts:
-            continue
-        
-        kind = parts[0].upper()
-        
-        if kind == "CHAPTER" and len(parts) >= 3:
-            code = parts[1]
-            title = parts[2]
-            
-            kv = {}
-            for p in parts[3:]:
-                if '=' in p:
-                    k, v = p.split('=', 1)
+    # Stream the file instead of materializing the whole text + line list
+    with toc_file.open(encoding='utf-8', errors='replace') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            parts = [p.strip() for p in line.split('|')]
+            if not parts:
+                continue
+
+            kind = parts[0].upper()
+
+            if kind == "CHAPTER" and len(parts) >= 3:
+                code = parts[1]
+                title = parts[2]
+
+                kv = {}
+                for p in parts[3:]:
+                    k, sep, v = p.partition('=')
+                    if not sep:
+                        continue
                     k, v = k.strip(), v.strip()
                     kv[k] = int(v) if v.isdigit() else v
-            
-            current_chapter = {
-                "code": code,
-                "title": title,
-                "start": kv.get("start", 1),
-                "end": kv.get("end", kv.get("start", 1)),
-                "sections": []
-            }
-            result["chapters"].append(current_chapter)
-        
-        elif kind == "SECTION" and len(parts) >= 3:
-            if current_chapter is None:
-                continue
-            
-            code = parts[1]
-            title = parts[2]
-            
-            kv = {}
-            for p in parts[3:]:
-                if '=' in p:
-                    k, v = p.split('=', 1)
+
+                current_chapter = {
+                    "code": code,
+                    "title": title,
+                    "start": kv.get("start", 1),
+                    "end": kv.get("end", kv.get("start", 1)),
+                    "sections": []
+                }
+                result["chapters"].append(current_chapter)
+
+            elif kind == "SECTION" and len(parts) >= 3:
+                if current_chapter is None:
+                    continue
+
+                code = parts[1]
+                title = parts[2]
+
+                kv = {}
+                for p in parts[3:]:
+                    k, sep, v = p.partition('=')
+                    if not sep:
+                        continue
                     k, v = k.strip(), v.strip()
                     kv[k] = int(v) if v.isdigit() else v
-            
-            current_chapter["sections"].append({
-                "code": code,
-                "title": title,
-                "start": kv.get("start", 1),
-                "end": kv.get("end", kv.get("start", 1))
-            })
-    
+
+                current_chapter["sections"].append({
+                    "code": code,
+                    "title": title,
+                    "start": kv.get("start", 1),
+                    "end": kv.get("end", kv.get("start", 1))
+                })
+
     return result
 
 
-def discover_books() -> List[Path]:
-    """Find all book folders."""
+def discover_books() -> List[Tuple[Path, Path, List[Tuple[str, str]]]]:
+    """Find all book folders, keeping the scan results for reuse."""
     if not BOOKS_ROOT.exists():
         return []
-    
+
     books = []
-    for folder in BOOKS_ROOT.iterdir():
-        if folder.is_dir() and not folder.name.startswith('.'):
-            if find_pages_folder(folder):
-                books.append(folder)
-    
-    return sorted(books, key=lambda p: p.name.lower())
+    with os.scandir(BOOKS_ROOT) as it:
+        for folder in it:
+            if folder.is_dir(follow_symlinks=False) and not folder.name.startswith('.'):
+                scanned = scan_book(Path(folder.path))
+                if scanned:
+                    books.append((Path(folder.path), *scanned))
 
+    return sorted(books, key=lambda b: b[0].name.lower())
 
-def build_viewer(book_dir: Path) -> bool:
+
+def build_viewer(book_dir: Path, pages_folder: Path, images: List[Tuple[str, str]], template_parts: List[str]) -> bool:
     """Generate viewer-dev.html for a single book."""
     print(f"\nProcessing: {book_dir.name}")
-    
-    pages_folder = find_pages_folder(book_dir)
-    if not pages_folder:
-        print(f"  ✗ No pages found")
-        return False
-    
-    images = find_images(pages_folder)
-    if not images:
-        print(f"  ✗ No images found")
-        return False
-    
+
     img_base = "" if pages_folder == book_dir else pages_folder.name.lower()
-    
+
     toc_file = find_toc_file(book_dir)
     toc_data = parse_toc(toc_file)
-    
-    template = TEMPLATE_FILE.read_text(encoding='utf-8')
-    
-    viewer_html = template.replace('__BOOK_NAME__', book_dir.name)
-    viewer_html = viewer_html.replace('__IMG_BASE__', json.dumps(img_base))
-    viewer_html = viewer_html.replace('__PAGES__', json.dumps([img.name for img in images]))
-    viewer_html = viewer_html.replace('__TOC__', json.dumps(toc_data))
-    
+
+    subs = {
+        '__BOOK_NAME__': book_dir.name,
+        '__IMG_BASE__': json.dumps(img_base),
+        '__TOC__': json.dumps(toc_data),
+    }
+
+    # Stream the template to disk; the page-name array is written name
+    # by name so the full HTML never sits in memory
     output_file = book_dir / "viewer-dev.html"
-    output_file.write_text(viewer_html, encoding='utf-8')
-    
+    with output_file.open('w', encoding='utf-8') as out:
+        for i, part in enumerate(template_parts):
+            if i % 2 == 0:
+                out.write(part)
+            elif part == '__PAGES__':
+                out.write('[')
+                for j, (name, _) in enumerate(images):
+                    if j:
+                        out.write(', ')
+                    out.write(json.dumps(name))
+                out.write(']')
+            else:
+                out.write(subs.get(part, part))
+
     print(f"  ✓ {len(images)} pages, {len(toc_data['chapters'])} chapters")
     print(f"  ✓ viewer-dev.html created")
-    
+
     return True
 
 
+def _build_one(book, template_parts: List[str]) -> bool:
+    return build_viewer(*book, template_parts)
+
+
 def main():
     print("=" * 60)
     print("BOOK VIEWER DEV BUILDER")
@@ -192,8 +233,13 @@ def main():
         return 1
     
     print(f"\nFound {len(books)} books")
-    
-    success = sum(1 for book in books if build_viewer(book))
+
+    # Read and split the static template once for all books
+    template_parts = PLACEHOLDER.split(TEMPLATE_FILE.read_text(encoding='utf-8'))
+
+    # Each book builds independently — spread them across all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        success = sum(ex.map(functools.partial(_build_one, template_parts=template_parts), books))
     
     print("\n" + "=" * 60)
     print(f"✓ Built {success}/{len(books)} dev viewers")
@@ -5,8 +5,10 @@ Usage: python export-pdf.py <book-folder> <from> <to>
        python export-pdf.py <book-folder> <from> <to> <output.pdf>
 """
 
+import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -17,7 +19,35 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow"])
     from PIL import Image
 
-IMAGE_EXTS = {".webp", ".jpg", ".jpeg", ".png", ".gif"}
+# Optional: img2pdf copies JPEG streams into the PDF bit-for-bit, with no
+# decode/re-encode round trip (and no double-compression artifacts)
+try:
+    import img2pdf
+except ImportError:
+    img2pdf = None
+
+# Extensions without the dot, matched against name.rsplit('.', 1)
+IMAGE_EXTS = frozenset({"webp", "jpg", "jpeg", "png", "gif"})
+
+# Numeric-sort pattern, compiled once — num_key runs per filename
+_NUM_RE = re.compile(r'(\d+)')
+
+# Formats img2pdf can embed losslessly without re-encoding
+LOSSLESS_EMBED_EXTS = {"jpg", "jpeg"}
+
+
+def has_images(folder: Path) -> bool:
+    """True if the folder directly contains at least one page image."""
+    try:
+        with os.scandir(folder) as it:
+            return any(
+                e.is_file(follow_symlinks=False)
+                and '.' in e.name
+                and e.name.rsplit('.', 1)[-1].lower() in IMAGE_EXTS
+                for e in it
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 
 def find_pages_folder(book_dir: Path) -> Path:
@@ -25,31 +55,53 @@ def find_pages_folder(book_dir: Path) -> Path:
     # Check for pages subfolder first
     for name in ["pages", "Pages", "PAGES"]:
         p = book_dir / name
-        if p.exists() and any(f.suffix.lower() in IMAGE_EXTS for f in p.iterdir()):
+        if has_images(p):
             return p
-    
+
     # Check book folder itself
-    if any(f.suffix.lower() in IMAGE_EXTS for f in book_dir.iterdir() if f.is_file()):
+    if has_images(book_dir):
         return book_dir
-    
+
     # Check any subfolder (skip thumbs)
-    for sub in book_dir.iterdir():
-        if sub.is_dir() and sub.name.lower() not in {"thumbs", "thumb", "thumbnails"}:
-            if any(f.suffix.lower() in IMAGE_EXTS for f in sub.iterdir() if f.is_file()):
-                return sub
-    
+    with os.scandir(book_dir) as it:
+        for sub in it:
+            if sub.is_dir(follow_symlinks=False) and sub.name.lower() not in {"thumbs", "thumb", "thumbnails"}:
+                if has_images(Path(sub.path)):
+                    return Path(sub.path)
+
     return book_dir
 
 
 def get_sorted_images(folder: Path) -> list:
-    """Get images sorted numerically."""
-    images = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in IMAGE_EXTS]
-    
-    def num_key(p):
-        m = re.search(r'(\d+)', p.name)
-        return (int(m.group(1)), p.name.lower()) if m else (999999, p.name.lower())
-    
-    return sorted(images, key=num_key)
+    """Get images as (name, path) tuples sorted numerically."""
+    # Numeric sort key is stored on each tuple so sort() compares in C
+    entries = []
+    with os.scandir(folder) as it:
+        for e in it:
+            if not e.is_file(follow_symlinks=False):
+                continue
+            name = e.name
+            lower = name.lower()
+            if '.' not in lower or lower.rsplit('.', 1)[-1] not in IMAGE_EXTS:
+                continue
+            m = _NUM_RE.search(name)
+            entries.append(((int(m.group(1)) if m else 999999, lower), name, e.path))
+
+    entries.sort()
+    return [(name, path) for _, name, path in entries]
+
+
+def _load_rgb(entry) -> "Image.Image":
+    """Open a (name, path) image entry and normalize it to RGB."""
+    img = Image.open(entry[1])
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    else:
+        # Image.open is lazy and convert() is a no-op for RGB sources,
+        # so force the decode here — inside the worker thread — rather
+        # than serially in save()
+        img.load()
+    return img
 
 
 def export_pdf(book_path: str, from_page: int, to_page: int, output: str = None):
@@ -83,18 +135,22 @@ def export_pdf(book_path: str, from_page: int, to_page: int, output: str = None)
     else:
         output = Path(output)
     
-    # Convert to RGB and save as PDF
-    pdf_images = []
-    for i, img_path in enumerate(selected):
-        print(f"  Processing {i + 1}/{len(selected)}: {img_path.name}")
-        img = Image.open(img_path)
-        if img.mode in ('RGBA', 'P'):
-            img = img.convert('RGB')
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        pdf_images.append(img)
-    
-    if pdf_images:
+    # Fast path: source JPEGs are copied into the PDF bit-for-bit, so no
+    # decode or re-encode happens at all.
+    if img2pdf is not None and all(
+        name.rsplit('.', 1)[-1].lower() in LOSSLESS_EMBED_EXTS for name, _ in selected
+    ):
+        print(f"  Embedding {len(selected)} JPEG pages losslessly...")
+        with open(output, "wb") as f:
+            f.write(img2pdf.convert([path for _, path in selected]))
+    else:
+        # Convert to RGB and save as PDF. Pillow releases the GIL during
+        # decode, so a thread pool decodes pages in parallel; ex.map keeps
+        # the page order.
+        print(f"  Decoding {len(selected)} pages...")
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            pdf_images = list(ex.map(_load_rgb, selected))
+
         pdf_images[0].save(
             output,
             "PDF",
@@ -102,9 +158,10 @@ def export_pdf(book_path: str, from_page: int, to_page: int, output: str = None)
             append_images=pdf_images[1:] if len(pdf_images) > 1 else [],
             resolution=100.0
         )
-        print(f"\n✓ Saved: {output}")
-        print(f"  Size: {output.stat().st_size / 1024 / 1024:.1f} MB")
-    
+
+    print(f"\n✓ Saved: {output}")
+    print(f"  Size: {output.stat().st_size / 1024 / 1024:.1f} MB")
+
     return 0
 
 
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import os
 from pathlib import Path
 
 def find_gallery_root(start: Path) -> Path:
@@ -11,59 +12,72 @@ BASE = find_gallery_root(Path.cwd())
 BOOKS = BASE / "books"
 OUT = BASE / "index.html"
 
-tiles = []
-
-for book in sorted(BOOKS.iterdir()):
-    if not book.is_dir():
-        continue
-
-    thumb = book / "thumbs" / "001.webp"
-    viewer = book / "viewer.html"
-
-    if thumb.exists() and viewer.exists():
-        tiles.append(f"""
-    <a href="books/{book.name}/viewer.html" class="tile">
-      <img src="books/{book.name}/thumbs/001.webp" alt="">
-    </a>
-        """)
-
-html = f"""<!DOCTYPE html>
+HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <style>
-  body {{
+  body {
     margin: 0;
     padding: 40px;
     background: #f5f5f5;
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(220px, 1fr));
     gap: 40px;
-  }}
+  }
 
-  .tile {{
+  .tile {
     display: block;
     transition: transform 0.25s ease, box-shadow 0.25s ease;
-  }}
+  }
 
-  .tile:hover {{
+  .tile:hover {
     transform: scale(1.12);
     box-shadow: 0 18px 36px rgba(0,0,0,0.25);
-  }}
+  }
 
-  img {{
+  img {
     width: 100%;
     height: auto;
     display: block;
-  }}
+  }
 </style>
 </head>
 <body>
-{''.join(tiles)}
-</body>
+"""
+
+FOOTER = """</body>
 </html>
 """
 
-OUT.write_text(html, encoding="utf-8")
-print(f"✓ Built index with {len(tiles)} books → {OUT}")
+# Collect book dirs in one scandir pass (DirEntry caches the dir check)
+with os.scandir(BOOKS) as it:
+    books = sorted((e.name, e.path) for e in it if e.is_dir(follow_symlinks=False))
+
+# Stream tiles straight to the output file — no tiles list, no joined
+# copy of the whole page in memory
+count = 0
+with OUT.open("w", encoding="utf-8") as f:
+    f.write(HEADER)
+    for name, path in books:
+        # One scandir of the book folder checks both children at once
+        has_viewer = False
+        has_thumbs = False
+        with os.scandir(path) as it:
+            for e in it:
+                if e.name == "viewer.html":
+                    has_viewer = e.is_file(follow_symlinks=False)
+                elif e.name == "thumbs":
+                    has_thumbs = e.is_dir(follow_symlinks=False)
+
+        if has_viewer and has_thumbs and os.path.isfile(os.path.join(path, "thumbs", "001.webp")):
+            f.write(
+                f'<a href="books/{name}/viewer.html" class="tile">\n'
+                f'  <img src="books/{name}/thumbs/001.webp" alt="">\n'
+                f'</a>\n'
+            )
+            count += 1
+    f.write(FOOTER)
+
+print(f"✓ Built index with {count} books → {OUT}")
@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Pillow resizes in-process (no subprocess spawn, GIL released during
+# decode/resize/encode); ImageMagick stays as the fallback
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 BASE = Path(__file__).parent           # folder where this script lives
 PAGES_DIR = BASE / "pages"             # input images
 THUMBS_DIR = BASE / "thumbs"           # output thumbnails
 
-SIZE = "300x300"                       # max width/height
+SIZE = (300, 300)                      # max width/height
 
 # Which extensions to process
 EXTS = [".webp"]
 
+# How many files to hand to one mogrify call (keeps argv well under OS limits)
+BATCH_SIZE = 500
+
 def run(cmd):
     print("Running:", " ".join(map(str, cmd)))
     subprocess.run(cmd, check=True)
@@ -18,6 +30,12 @@ def run(cmd):
 def make_dirs():
     THUMBS_DIR.mkdir(exist_ok=True, parents=True)
 
+def make_one(src):
+    img = Image.open(src)
+    img.thumbnail(SIZE, Image.LANCZOS)
+    kwargs = {"method": 6} if src.suffix.lower() == ".webp" else {}
+    img.save(THUMBS_DIR / src.name, **kwargs)
+
 def make_thumbs():
     make_dirs()
     if not PAGES_DIR.exists():
@@ -31,13 +49,25 @@ def make_thumbs():
         print("No images found in", PAGES_DIR)
         return
 
-    for src in sorted(files):
-        dst = THUMBS_DIR / src.name
+    files = sorted(files)
+
+    if Image is not None:
+        # Decode/resize/encode run in parallel threads — Pillow drops the
+        # GIL in its C image codecs
+        print(f"Resizing {len(files)} images with Pillow...")
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(make_one, files))
+        return
+
+    # Fallback: one mogrify call per batch instead of one magick process
+    # per image — ImageMagick startup (~50-100ms) dominates otherwise
+    for i in range(0, len(files), BATCH_SIZE):
+        batch = files[i:i + BATCH_SIZE]
         run([
-            "magick",
-            str(src),
-            "-resize", SIZE,
-            str(dst),
+            "magick", "mogrify",
+            "-path", str(THUMBS_DIR),
+            "-resize", f"{SIZE[0]}x{SIZE[1]}",
+            *[str(src) for src in batch],
         ])
 
 if __name__ == "__main__":
@@ -46,4 +76,3 @@ if __name__ == "__main__":
     print("Output (thumbs):", THUMBS_DIR)
     make_thumbs()
     print("Done.")
-
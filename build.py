@@ -4,78 +4,139 @@ build.py - Generate viewer.html for each book folder in ./books
 Portable: no hardcoded drive paths. Root is auto-detected from this script location.
 """
 
+import functools
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-IMAGE_EXTS = {".webp", ".jpg", ".jpeg", ".png", ".gif"}
+# Extensions without the dot: checked against name.rsplit('.', 1) so no
+# Path object is built just to look at a suffix.
+IMAGE_EXTS = frozenset({"webp", "jpg", "jpeg", "png", "gif"})
 
+# Numeric-sort pattern, compiled once — num_key runs per filename
+_NUM_RE = re.compile(r"(\d+)")
 
-def find_site_root(start: Path) -> Path:
+# Subfolder names that never hold page images
+SKIP_DIRS = {"thumbs", "thumb", "thumbnails", "tn"}
+
+
+def find_site_root(start: str) -> Path:
     """
     Walk upward from 'start' and find a repo/site root.
 
     Detection order:
-      1) .git folder (best, real repo root)
+      1) .git (best, real repo root)
       2) books folder (good for copied folders without git metadata)
+
+    The walk itself is plain dirname/exists string work; only the found
+    root becomes a Path.
     """
-    for p in [start, *start.parents]:
-        if (p / ".git").exists():
-            return p
-        if (p / "books").exists():
-            return p
-    raise RuntimeError("Could not find site root (no .git/ or books/ found).")
+    p = start
+    while True:
+        if os.path.exists(os.path.join(p, ".git")) or os.path.isdir(os.path.join(p, "books")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            raise RuntimeError("Could not find site root (no .git/ or books/ found).")
+        p = parent
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-ROOT = find_site_root(SCRIPT_DIR)
+ROOT = find_site_root(os.path.dirname(os.path.abspath(__file__)))
 
 BOOKS_ROOT = ROOT / "books"
 TEMPLATE_FILE = ROOT / "viewer-template.html"
 
+# Per-book state hashes from the previous run; books whose template,
+# TOC, and image list are unchanged get skipped entirely.
+CACHE_FILE = BOOKS_ROOT / ".build-cache.json"
+
+# All template placeholders share the __NAME__ shape. The capturing
+# group lets PLACEHOLDER.split() keep the placeholders, so the template
+# is split once per run and streamed straight to each viewer file.
+PLACEHOLDER = re.compile(r"(__[A-Z_]+__)")
 
-def find_images(folder: Path) -> List[Path]:
-    if not folder.exists():
-        return []
 
-    images = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in IMAGE_EXTS]
+def find_images(folder: Path) -> List[Tuple[str, str]]:
+    """
+    Return sorted (name, path) tuples for the page images in 'folder'.
+
+    Plain strings are kept on purpose: the builders only ever need the
+    file name, so wrapping every entry in a Path would allocate objects
+    that are immediately thrown away.
+    """
+    # os.scandir reuses the metadata from the directory listing, so the
+    # is_file() check below costs no extra stat() per entry (pathlib does).
+    # A missing folder surfaces as an exception from the one syscall we
+    # make anyway, instead of costing a separate exists() stat up front.
+    #
+    # Each name is lowercased once, and the numeric sort key is stored on
+    # the entry tuple so sort() compares tuples in C with no key callback.
+    entries = []
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                name = e.name
+                lower = name.lower()
+                if "." not in lower or lower.rsplit(".", 1)[-1] not in IMAGE_EXTS:
+                    continue
+                m = _NUM_RE.search(name)
+                entries.append(((int(m.group(1)) if m else 999999, lower), name, e.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
-    def num_key(p: Path):
-        m = re.search(r"(\d+)", p.name)
-        return (int(m.group(1)), p.name.lower()) if m else (999999, p.name.lower())
+    entries.sort()
+    return [(name, path) for _, name, path in entries]
 
-    images.sort(key=num_key)
-    return images
 
+def scan_book(book_dir: Path) -> Optional[Tuple[Path, List[Tuple[str, str]]]]:
+    """
+    Locate the pages folder of a book and its images in a single pass.
 
-def find_pages_folder(book_dir: Path) -> Optional[Path]:
+    Returns (pages_folder, images) so callers never have to re-scan the
+    same directory, or None when the book has no images at all.
+    """
     # If images are directly in the book folder, use it.
-    if find_images(book_dir):
-        return book_dir
+    images = find_images(book_dir)
+    if images:
+        return book_dir, images
 
     # Otherwise look for the first subfolder (excluding thumbs-like folders) containing images.
-    if not book_dir.exists():
-        return None
-
-    for sub in book_dir.iterdir():
-        if sub.is_dir() and sub.name.lower() not in {"thumbs", "thumb", "thumbnails", "tn"}:
-            if find_images(sub):
-                return sub
+    try:
+        with os.scandir(book_dir) as it:
+            for sub in it:
+                if sub.is_dir(follow_symlinks=False) and sub.name.lower() not in SKIP_DIRS:
+                    images = find_images(Path(sub.path))
+                    if images:
+                        return Path(sub.path), images
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     return None
 
 
 def find_toc_file(book_dir: Path) -> Optional[Path]:
-    txt_files = list(book_dir.glob("*.txt"))
-    if not txt_files:
+    # Prefer files containing 'toc' in the name, else take first .txt.
+    # One streamed scandir pass, returning as soon as a 'toc' file shows
+    # up, instead of materializing a glob list first.
+    first_txt = None
+    try:
+        with os.scandir(book_dir) as it:
+            for e in it:
+                if not e.name.endswith(".txt") or not e.is_file(follow_symlinks=False):
+                    continue
+                if "toc" in e.name.lower():
+                    return Path(e.path)
+                if first_txt is None:
+                    first_txt = Path(e.path)
+    except FileNotFoundError:
         return None
-
-    # Prefer files containing 'toc' in the name, else take first .txt
-    for f in txt_files:
-        if "toc" in f.name.lower():
-            return f
-    return txt_files[0]
+    return first_txt
 
 
 def parse_toc(toc_file: Optional[Path]):
@@ -98,108 +159,180 @@ def parse_toc(toc_file: Optional[Path]):
 
     current_chapter = None
 
-    for raw in toc_file.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        parts = [p.strip() for p in line.split("|") if p.strip() != ""]
-        if not parts:
-            continue
-
-        kind = parts[0].upper()
-
-        if kind == "OFFSET" and len(parts) >= 2:
-            try:
-                offset = int(parts[1])
-            except ValueError:
-                pass
-            continue
-
-        if kind == "CHAPTER" and len(parts) >= 3:
-            kv = {}
-            for p in parts[3:]:
-                if "=" in p:
-                    k, v = p.split("=", 1)
+    # Stream the file instead of materializing the whole text + line list
+    with toc_file.open(encoding="utf-8", errors="replace") as fh:
+        for raw in fh:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = [s for s in (p.strip() for p in line.split("|")) if s]
+            if not parts:
+                continue
+
+            kind = parts[0].upper()
+
+            if kind == "OFFSET" and len(parts) >= 2:
+                try:
+                    offset = int(parts[1])
+                except ValueError:
+                    pass
+                continue
+
+            if kind == "CHAPTER" and len(parts) >= 3:
+                kv = {}
+                for p in parts[3:]:
+                    k, sep, v = p.partition("=")
+                    if not sep:
+                        continue
                     v = v.strip()
                     kv[k.strip()] = int(v) if v.isdigit() else v
 
-            current_chapter = {
-                "code": parts[1],
-                "title": parts[2],
-                "start": kv.get("start", 1),
-                "end": kv.get("end", kv.get("start", 1)),
-                "sections": [],
-            }
-            result["chapters"].append(current_chapter)
-            continue
-
-        if kind == "SECTION" and len(parts) >= 3 and current_chapter:
-            kv = {}
-            for p in parts[3:]:
-                if "=" in p:
-                    k, v = p.split("=", 1)
-                    v = v.strip()
-                    kv[k.strip()] = int(v) if v.isdigit() else v
-
-            current_chapter["sections"].append(
-                {
+                current_chapter = {
                     "code": parts[1],
                     "title": parts[2],
                     "start": kv.get("start", 1),
                     "end": kv.get("end", kv.get("start", 1)),
+                    "sections": [],
                 }
-            )
+                result["chapters"].append(current_chapter)
+                continue
+
+            if kind == "SECTION" and len(parts) >= 3 and current_chapter:
+                kv = {}
+                for p in parts[3:]:
+                    k, sep, v = p.partition("=")
+                    if not sep:
+                        continue
+                    v = v.strip()
+                    kv[k.strip()] = int(v) if v.isdigit() else v
+
+                current_chapter["sections"].append(
+                    {
+                        "code": parts[1],
+                        "title": parts[2],
+                        "start": kv.get("start", 1),
+                        "end": kv.get("end", kv.get("start", 1)),
+                    }
+                )
 
     return result, offset
 
 
-def discover_books() -> List[Path]:
+def discover_books() -> List[Tuple[Path, Path, List[Tuple[str, str]]]]:
     if not BOOKS_ROOT.exists():
         return []
 
-    # Only include dirs that contain images (directly or in a subfolder)
+    # Only include dirs that contain images (directly or in a subfolder).
+    # Keep the scan result so build_viewer doesn't re-walk the same dirs.
     books = []
-    for d in BOOKS_ROOT.iterdir():
-        if d.is_dir() and not d.name.startswith(".") and find_pages_folder(d):
-            books.append(d)
-
-    return sorted(books, key=lambda p: p.name.lower())
-
-
-def build_viewer(book_dir: Path) -> bool:
+    with os.scandir(BOOKS_ROOT) as it:
+        for d in it:
+            if d.is_dir(follow_symlinks=False) and not d.name.startswith("."):
+                scanned = scan_book(Path(d.path))
+                if scanned:
+                    books.append((Path(d.path), *scanned))
+
+    return sorted(books, key=lambda b: b[0].name.lower())
+
+
+def _state_hash(
+    book_dir: Path,
+    pages_folder: Path,
+    images: List[Tuple[str, str]],
+    toc_file: Optional[Path],
+    template_mtime: int,
+) -> str:
+    """
+    Fingerprint everything a viewer is built from: the book and pages
+    folder names (both end up in the generated HTML — a rename keeps
+    every mtime, so names must be hashed explicitly), the template
+    mtime, the TOC file mtime, and the sorted image names with their
+    mtimes.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(book_dir.name.encode())
+    h.update(pages_folder.name.encode())
+    h.update(str(template_mtime).encode())
+    if toc_file is not None:
+        h.update(toc_file.name.encode())
+        h.update(str(toc_file.stat().st_mtime_ns).encode())
+    for name, path in images:
+        h.update(name.encode())
+        h.update(str(os.stat(path).st_mtime_ns).encode())
+    return h.hexdigest()
+
+
+def build_viewer(
+    book_dir: Path,
+    pages_folder: Path,
+    images: List[Tuple[str, str]],
+    template_parts: List[str],
+    template_mtime: int,
+    cached_hash: Optional[str] = None,
+) -> Tuple[bool, str]:
     print(f"\nProcessing: {book_dir.name}")
 
-    pages_folder = find_pages_folder(book_dir)
-    if not pages_folder:
-        print("  ✗ No pages folder found")
-        return False
+    toc_file = find_toc_file(book_dir)
 
-    images = find_images(pages_folder)
-    if not images:
-        print("  ✗ No images found")
-        return False
+    state = _state_hash(book_dir, pages_folder, images, toc_file, template_mtime)
+    if state == cached_hash and (book_dir / "viewer.html").exists():
+        print("  ⤳ up-to-date")
+        return True, state
 
     # If pages are in a subfolder, pass the folder name to the template; else empty string.
     img_base = "" if pages_folder == book_dir else pages_folder.name
 
-    toc_data, page_offset = parse_toc(find_toc_file(book_dir))
+    toc_data, page_offset = parse_toc(toc_file)
+
+    subs = {
+        "__BOOK_NAME__": book_dir.name,
+        "__IMG_BASE__": json.dumps(img_base),
+        "__TOC__": json.dumps(toc_data),
+        "__PAGE_OFFSET__": str(page_offset),
+    }
+
+    # Stream the template to disk part by part. The page-name array —
+    # the one substitution that grows with book size — is written name
+    # by name, so the full viewer HTML never exists in memory at once.
+    with (book_dir / "viewer.html").open("w", encoding="utf-8") as out:
+        for i, part in enumerate(template_parts):
+            if i % 2 == 0:
+                out.write(part)
+            elif part == "__PAGES__":
+                out.write("[")
+                for j, (name, _) in enumerate(images):
+                    if j:
+                        out.write(", ")
+                    out.write(json.dumps(name))
+                out.write("]")
+            else:
+                out.write(subs.get(part, part))
 
-    if not TEMPLATE_FILE.exists():
-        print(f"  ✗ Template not found: {TEMPLATE_FILE}")
-        return False
+    print(f"  ✓ {len(images)} pages, {len(toc_data['chapters'])} chapters, offset={page_offset}")
+    return True, state
 
-    template = TEMPLATE_FILE.read_text(encoding="utf-8", errors="replace")
 
-    viewer_html = template.replace("__BOOK_NAME__", book_dir.name)
-    viewer_html = viewer_html.replace("__IMG_BASE__", json.dumps(img_base))
-    viewer_html = viewer_html.replace("__PAGES__", json.dumps([img.name for img in images]))
-    viewer_html = viewer_html.replace("__TOC__", json.dumps(toc_data))
-    viewer_html = viewer_html.replace("__PAGE_OFFSET__", str(page_offset))
+def _build_one(
+    book: Tuple[Path, Path, List[Tuple[str, str]]],
+    template_parts: List[str],
+    template_mtime: int,
+    cache: dict,
+) -> Tuple[str, str, bool]:
+    book_dir, pages_folder, images = book
+    ok, state = build_viewer(
+        book_dir, pages_folder, images, template_parts, template_mtime, cache.get(book_dir.name)
+    )
+    return book_dir.name, state, ok
 
-    (book_dir / "viewer.html").write_text(viewer_html, encoding="utf-8")
-    print(f"  ✓ {len(images)} pages, {len(toc_data['chapters'])} chapters, offset={page_offset}")
-    return True
+
+def _load_cache() -> dict:
+    try:
+        with CACHE_FILE.open(encoding="utf-8") as fh:
+            cache = json.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
 
 
 def main() -> int:
@@ -214,11 +347,33 @@ def main() -> int:
         print("\n✗ No books found. Ensure you have: ./books/<BookName>/pages...")
         return 1
 
+    if not TEMPLATE_FILE.exists():
+        print(f"\n✗ Template not found: {TEMPLATE_FILE}")
+        return 1
+
+    # Read and split the (static) template once, not once per book.
+    template = TEMPLATE_FILE.read_text(encoding="utf-8", errors="replace")
+    build_one = functools.partial(
+        _build_one,
+        template_parts=PLACEHOLDER.split(template),
+        template_mtime=TEMPLATE_FILE.stat().st_mtime_ns,
+        cache=_load_cache(),
+    )
+
     print(f"\nFound {len(books)} books")
-    success = 0
-    for book in books:
-        if build_viewer(book):
-            success += 1
+    # Books are independent (own TOC, own pages, own viewer.html), so
+    # build them across all cores instead of one after another.
+    if len(books) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = list(ex.map(build_one, books))
+    else:
+        results = [build_one(book) for book in books]
+
+    success = sum(ok for _, _, ok in results)
+
+    # Remember the state of every successful build for the next run
+    new_cache = {name: state for name, state, ok in results if ok}
+    CACHE_FILE.write_text(json.dumps(new_cache, indent=2), encoding="utf-8")
 
     print("\n" + "=" * 58)
     print(f"✓ Built {success}/{len(books)} viewers")
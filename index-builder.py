@@ -10,8 +10,14 @@ Portable: root auto-detected.
 
 from __future__ import annotations
 
+import html
+import json
+import operator
+import os
 import re
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -23,18 +29,22 @@ TAGLINE = "Interactive explorations, notes, and book viewers"
 # ----------------------------------
 
 
-def find_site_root(start: Path) -> Path:
-    for p in [start, *start.parents]:
-        if (p / ".git").exists():
-            return p
-        if (p / "books").exists():
-            return p
-    raise RuntimeError("Could not find site root (no .git/ or books/ found).")
+def find_site_root(start: str) -> Path:
+    # Plain dirname/exists string walk; only the found root becomes a Path.
+    p = start
+    while True:
+        if os.path.exists(os.path.join(p, ".git")) or os.path.isdir(os.path.join(p, "books")):
+            return Path(p)
+        parent = os.path.dirname(p)
+        if parent == p:
+            raise RuntimeError("Could not find site root (no .git/ or books/ found).")
+        p = parent
 
 
-ROOT = find_site_root(Path(__file__).resolve().parent)
+ROOT = find_site_root(os.path.dirname(os.path.abspath(__file__)))
 BOOKS_DIR = ROOT / "books"
 OUT = ROOT / "index.html"
+CACHE_FILE = ROOT / ".index-cache.json"
 
 IGNORE_ROOT_HTML = {
     "index.html",
@@ -43,204 +53,14 @@ IGNORE_ROOT_HTML = {
 IGNORE_PREFIXES = ("_", ".")
 IMAGE_EXTS = (".webp", ".png", ".jpg", ".jpeg")
 
+# Metadata patterns, compiled once — these run against every root HTML
+# file on every build.
+_HEAD_BYTES = 8192
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r"\s+")
 
-@dataclass
-class AppLink:
-    href: str
-    title: str
-    topic: str
-    desc: str
-
-
-@dataclass
-class BookTile:
-    viewer_href: str
-    cover_src: str
-    name: str
-
-
-def extract_title(html_text: str) -> Optional[str]:
-    m = re.search(r"<title>(.*?)</title>", html_text, flags=re.IGNORECASE | re.DOTALL)
-    if not m:
-        return None
-    return re.sub(r"\s+", " ", m.group(1)).strip() or None
-
-
-def extract_meta_comment(html_text: str, key: str) -> Optional[str]:
-    m = re.search(rf"<!--\s*{re.escape(key)}\s*:\s*(.*?)\s*-->", html_text, flags=re.IGNORECASE)
-    return (m.group(1).strip() if m else None) or None
-
-
-def label_from_filename(p: Path) -> str:
-    stem = p.stem.replace("-", " ").replace("_", " ").strip()
-    return stem.title() if stem else p.name
-
-
-def collect_root_apps() -> Dict[str, List[AppLink]]:
-    groups: Dict[str, List[AppLink]] = {}
-
-    for f in sorted(ROOT.iterdir(), key=lambda p: p.name.lower()):
-        if not f.is_file():
-            continue
-        if f.suffix.lower() != ".html":
-            continue
-        if f.name.lower() in IGNORE_ROOT_HTML:
-            continue
-        if f.name.startswith(IGNORE_PREFIXES):
-            continue
-
-        text = f.read_text(encoding="utf-8", errors="replace")
-
-        topic = extract_meta_comment(text, "TOPIC") or "Unsorted"
-        desc = extract_meta_comment(text, "DESC") or ""
-        title = extract_title(text) or label_from_filename(f)
-
-        groups.setdefault(topic, []).append(AppLink(href=f.name, title=title, topic=topic, desc=desc))
-
-    for t in groups:
-        groups[t].sort(key=lambda a: a.title.lower())
-
-    # ordered topics, with Unsorted last
-    ordered: Dict[str, List[AppLink]] = {}
-    for t in sorted([k for k in groups.keys() if k.lower() != "unsorted"], key=str.lower):
-        ordered[t] = groups[t]
-    if "Unsorted" in groups:
-        ordered["Unsorted"] = groups["Unsorted"]
-
-    return ordered
-
-
-def first_existing_cover(book_dir: Path) -> Optional[Path]:
-    """
-    Cover preference:
-      1) pages/001.webp (or any ext)
-      2) thumbs/001.webp (or any ext)
-    """
-    for base in [book_dir / "pages", book_dir / "thumbs"]:
-        for ext in IMAGE_EXTS:
-            candidate = base / f"001{ext}"
-            if candidate.exists():
-                return candidate
-    return None
-
-
-def collect_books() -> List[BookTile]:
-    if not BOOKS_DIR.exists():
-        return []
-
-    tiles: List[BookTile] = []
-    for book in sorted(BOOKS_DIR.iterdir(), key=lambda p: p.name.lower()):
-        if not book.is_dir():
-            continue
-
-        viewer = book / "viewer.html"
-        if not viewer.exists():
-            continue
-
-        cover = first_existing_cover(book)
-        if not cover:
-            # If no cover found, still list it (text-only tile fallback)
-            tiles.append(BookTile(viewer_href=f"books/{book.name}/viewer.html", cover_src="", name=book.name))
-            continue
-
-        tiles.append(
-            BookTile(
-                viewer_href=f"books/{book.name}/viewer.html",
-                cover_src=str(cover.relative_to(ROOT)).replace("\\", "/"),
-                name=book.name,
-            )
-        )
-
-    return tiles
-
-
-def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]) -> str:
-    logo_svg = r"""
-<svg width="44" height="44" viewBox="0 0 44 44" aria-hidden="true">
-  <rect x="2" y="2" width="40" height="40" rx="12" fill="rgba(255,255,255,0.06)" stroke="rgba(255,255,255,0.10)"/>
-  <circle cx="16" cy="16" r="4" fill="white" opacity="0.90"/>
-  <circle cx="28" cy="16" r="4" fill="white" opacity="0.70"/>
-  <circle cx="16" cy="28" r="4" fill="white" opacity="0.70"/>
-  <circle cx="28" cy="28" r="4" fill="white" opacity="0.90"/>
-</svg>
-""".strip()
-
-    # Apps section
-    apps_html = ""
-    if app_groups:
-        topic_blocks = []
-        for topic, apps in app_groups.items():
-            cards = []
-            for a in apps:
-                desc_html = f"<p class='muted'>{a.desc}</p>" if a.desc else "<p class='muted'>&nbsp;</p>"
-                cards.append(f"""
-<a class="card" href="{a.href}">
-  <div class="card-title">{a.title}</div>
-  {desc_html}
-  <div class="chip">{topic}</div>
-</a>
-""".strip())
-            topic_blocks.append(f"""
-<section class="block">
-  <div class="block-head">
-    <h2>{topic}</h2>
-    <div class="count">{len(apps)} app{"s" if len(apps)!=1 else ""}</div>
-  </div>
-  <div class="grid">
-    {''.join(cards)}
-  </div>
-</section>
-""".strip())
-        apps_html = f"""
-<section class="section">
-  <div class="section-head">
-    <h1>Apps</h1>
-    <p class="muted">Drop any <code>.html</code> file into the site root and it appears here automatically.</p>
-  </div>
-  {''.join(topic_blocks)}
-</section>
-""".strip()
-
-    # Books section
-    book_tiles = []
-    for b in books:
-        if b.cover_src:
-            book_tiles.append(f"""
-<a href="{b.viewer_href}" class="tile" title="{b.name}">
-  <img src="{b.cover_src}" alt="{b.name}">
-  <div class="tile-label">{b.name}</div>
-</a>
-""".strip())
-        else:
-            # text-only fallback
-            book_tiles.append(f"""
-<a href="{b.viewer_href}" class="tile tile-text" title="{b.name}">
-  <div class="tile-label">{b.name}</div>
-</a>
-""".strip())
-
-    books_html = ""
-    if books:
-        books_html = f"""
-<section class="section">
-  <div class="section-head">
-    <h1>Books</h1>
-    <p class="muted">Viewer pages are discovered in <code>books/&lt;book&gt;/viewer.html</code>.</p>
-  </div>
-  <div class="tiles">
-    {''.join(book_tiles)}
-  </div>
-</section>
-""".strip()
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8" />
-<meta name="viewport" content="width=device-width, initial-scale=1.0" />
-<title>{SITE_OWNER} • {SITE_TITLE}</title>
-<style>
-  :root {{
+# The stylesheet is static — keep it out of the per-build f-string work.
+_CSS = """  :root {
     --bg: #0b0d10;
     --panel: rgba(255,255,255,0.06);
     --panel2: rgba(255,255,255,0.04);
@@ -249,22 +69,22 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     --muted: rgba(255,255,255,0.65);
     --shadow: 0 24px 60px rgba(0,0,0,0.45);
     --r: 18px;
-  }}
-  * {{ box-sizing: border-box; }}
-  body {{
+  }
+  * { box-sizing: border-box; }
+  body {
     margin: 0;
     font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Arial;
     background: radial-gradient(1200px 600px at 20% 0%, rgba(255,255,255,0.08), transparent 50%),
                 radial-gradient(900px 500px at 90% 10%, rgba(255,255,255,0.06), transparent 55%),
                 var(--bg);
     color: var(--text);
-  }}
-  .wrap {{
+  }
+  .wrap {
     max-width: 1100px;
     margin: 0 auto;
     padding: 28px 18px 60px;
-  }}
-  header {{
+  }
+  header {
     display: flex;
     align-items: center;
     gap: 14px;
@@ -273,25 +93,25 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     background: var(--panel);
     border-radius: var(--r);
     box-shadow: var(--shadow);
-  }}
-  .brand {{
+  }
+  .brand {
     display: flex;
     align-items: center;
     gap: 12px;
     min-width: 0;
-  }}
-  .brand h1 {{
+  }
+  .brand h1 {
     font-size: 18px;
     margin: 0;
     letter-spacing: 0.2px;
-  }}
-  .brand p {{
+  }
+  .brand p {
     margin: 2px 0 0;
     color: var(--muted);
     font-size: 13px;
-  }}
-  .spacer {{ flex: 1; }}
-  .pill {{
+  }
+  .spacer { flex: 1; }
+  .pill {
     border: 1px solid var(--stroke);
     background: var(--panel2);
     border-radius: 999px;
@@ -299,25 +119,25 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     color: var(--muted);
     font-size: 13px;
     white-space: nowrap;
-  }}
-  .section {{
+  }
+  .section {
     margin-top: 22px;
     padding: 18px;
     border: 1px solid var(--stroke);
     background: var(--panel2);
     border-radius: var(--r);
-  }}
-  .section-head h1 {{
+  }
+  .section-head h1 {
     font-size: 16px;
     margin: 0 0 6px;
-  }}
-  .muted {{
+  }
+  .muted {
     color: var(--muted);
     margin: 0;
     font-size: 13px;
     line-height: 1.35;
-  }}
-  code {{
+  }
+  code {
     font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
     font-size: 12px;
     color: rgba(255,255,255,0.82);
@@ -325,27 +145,27 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     padding: 2px 6px;
     border-radius: 8px;
     border: 1px solid rgba(255,255,255,0.08);
-  }}
-  .block {{ margin-top: 16px; }}
-  .block-head {{
+  }
+  .block { margin-top: 16px; }
+  .block-head {
     display: flex;
     align-items: baseline;
     justify-content: space-between;
     gap: 10px;
     margin-bottom: 10px;
-  }}
-  .block-head h2 {{
+  }
+  .block-head h2 {
     font-size: 14px;
     margin: 0;
     color: rgba(255,255,255,0.88);
-  }}
-  .count {{ color: var(--muted); font-size: 12px; }}
-  .grid {{
+  }
+  .count { color: var(--muted); font-size: 12px; }
+  .grid {
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(240px, 1fr));
     gap: 12px;
-  }}
-  .card {{
+  }
+  .card {
     display: block;
     text-decoration: none;
     color: inherit;
@@ -354,18 +174,18 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     border: 1px solid var(--stroke);
     background: rgba(0,0,0,0.18);
     transition: transform 120ms ease, background 120ms ease, border-color 120ms ease;
-  }}
-  .card:hover {{
+  }
+  .card:hover {
     transform: translateY(-2px);
     background: rgba(0,0,0,0.25);
     border-color: rgba(255,255,255,0.18);
-  }}
-  .card-title {{
+  }
+  .card-title {
     font-size: 14px;
     margin: 0 0 6px;
     letter-spacing: 0.1px;
-  }}
-  .chip {{
+  }
+  .chip {
     display: inline-block;
     margin-top: 10px;
     font-size: 11px;
@@ -374,14 +194,14 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     background: rgba(255,255,255,0.05);
     padding: 4px 8px;
     border-radius: 999px;
-  }}
-  .tiles {{
+  }
+  .tiles {
     margin-top: 10px;
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
     gap: 16px;
-  }}
-  .tile {{
+  }
+  .tile {
     display: block;
     text-decoration: none;
     color: inherit;
@@ -391,43 +211,61 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
     background: rgba(0,0,0,0.20);
     transition: transform 120ms ease, border-color 120ms ease;
     min-height: 60px;
-  }}
-  .tile:hover {{
+  }
+  .tile:hover {
     transform: translateY(-2px);
     border-color: rgba(255,255,255,0.18);
-  }}
-  .tile img {{
+  }
+  .tile img {
     width: 100%;
     height: 140px;
     object-fit: cover;
     object-position: top;
     display: block;
-  }}
-  .tile-label {{
+  }
+  .tile-label {
     padding: 10px 12px;
     font-size: 13px;
     color: rgba(255,255,255,0.82);
     white-space: nowrap;
     overflow: hidden;
     text-overflow: ellipsis;
-  }}
-  .tile.tile-text {{
+  }
+  .tile.tile-text {
     display: flex;
     align-items: center;
-  }}
-  footer {{
+  }
+  footer {
     margin-top: 22px;
     text-align: center;
     color: rgba(255,255,255,0.50);
     font-size: 12px;
-  }}
+  }"""
+
+_LOGO_SVG = r"""<svg width="44" height="44" viewBox="0 0 44 44" aria-hidden="true">
+  <rect x="2" y="2" width="40" height="40" rx="12" fill="rgba(255,255,255,0.06)" stroke="rgba(255,255,255,0.10)"/>
+  <circle cx="16" cy="16" r="4" fill="white" opacity="0.90"/>
+  <circle cx="28" cy="16" r="4" fill="white" opacity="0.70"/>
+  <circle cx="16" cy="28" r="4" fill="white" opacity="0.70"/>
+  <circle cx="28" cy="28" r="4" fill="white" opacity="0.90"/>
+</svg>"""
+
+# Document shell around the dynamic sections, interpolated once at import.
+_HEAD = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8" />
+<meta name="viewport" content="width=device-width, initial-scale=1.0" />
+<title>{SITE_OWNER} • {SITE_TITLE}</title>
+<style>
+{_CSS}
 </style>
 </head>
 <body>
   <div class="wrap">
     <header>
       <div class="brand">
-        {logo_svg}
+        {_LOGO_SVG}
         <div>
           <h1>{SITE_OWNER} • {SITE_TITLE}</h1>
           <p>{TAGLINE}</p>
@@ -437,8 +275,9 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
       <div class="pill">Auto-indexed • apps + books</div>
     </header>
 
-    {apps_html}
-    {books_html}
+    """
+
+_FOOTER = """
 
     <footer>
       Built by index-builder.py • Drop apps in root • Book viewers in books/&lt;book&gt;/
@@ -449,15 +288,300 @@ def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]
 """
 
 
+@dataclass
+class AppLink:
+    href: str
+    title: str
+    topic: str
+    desc: str
+    # Escaped once here rather than per use in the HTML build. Titles and
+    # descriptions come from page content, so this also stops a stray
+    # '<' or '&' from breaking the generated markup.
+    title_esc: str = field(init=False)
+    topic_esc: str = field(init=False)
+    desc_esc: str = field(init=False)
+    # Case-folded sort key, computed once instead of per comparison
+    title_key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.title_esc = html.escape(self.title)
+        self.topic_esc = html.escape(self.topic)
+        self.desc_esc = html.escape(self.desc)
+        self.title_key = self.title.lower()
+
+
+@dataclass
+class BookTile:
+    viewer_href: str
+    cover_src: str
+    name: str
+    name_esc: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.name_esc = html.escape(self.name)
+
+
+def extract_title(html_text: str) -> Optional[str]:
+    m = _TITLE_RE.search(html_text)
+    if not m:
+        return None
+    # The title is markup, so decode entities ('&amp;' -> '&') here;
+    # AppLink re-escapes exactly once on output either way.
+    return html.unescape(_WS_RE.sub(" ", m.group(1)).strip()) or None
+
+
+def extract_meta_comment(html_text: str, key: str) -> Optional[str]:
+    # str.find beats a regex scan here: HTML comments are rare and the
+    # key match is a plain substring comparison once the comment body is
+    # sliced out.
+    lower = html_text.lower()
+    needle = key.lower()
+    pos = 0
+    while True:
+        start = lower.find("<!--", pos)
+        if start < 0:
+            return None
+        end = lower.find("-->", start + 4)
+        if end < 0:
+            return None
+        k, sep, value = html_text[start + 4:end].partition(":")
+        if sep and k.strip().lower() == needle:
+            return value.strip() or None
+        pos = end + 3
+
+
+def label_from_filename(p: Path) -> str:
+    stem = p.stem.replace("-", " ").replace("_", " ").strip()
+    return stem.title() if stem else p.name
+
+
+def _scan_root_html() -> List[tuple[str, str, str]]:
+    """One scandir pass over the site root, yielding (name, path, cache key)
+    for app HTML files. The cache key folds in mtime and size, so any edit
+    invalidates the cached metadata for free."""
+    entries = []
+    with os.scandir(ROOT) as it:
+        for e in it:
+            if (
+                e.is_file(follow_symlinks=False)
+                and e.name.lower().endswith(".html")
+                and e.name.lower() not in IGNORE_ROOT_HTML
+                and not e.name.startswith(IGNORE_PREFIXES)
+            ):
+                st = e.stat(follow_symlinks=False)
+                entries.append((e.name, e.path, f"{e.name}:{st.st_mtime_ns}:{st.st_size}"))
+    entries.sort(key=lambda e: e[0].lower())
+    return entries
+
+
+def _load_cache() -> Dict[str, List[str]]:
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as fh:
+            cache = json.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _parse_one(entry: tuple[str, str, str]) -> tuple[str, List[str]]:
+    """Read one root HTML file and pull out (title, topic, desc).
+
+    The title and meta comments live in <head>, so an 8 KiB head read
+    covers almost every file; fall back to the full read only when no
+    <title> turned up (metadata unusually far down, or a multi-byte
+    character split at the boundary).
+    """
+    name, path, key = entry
+    with open(path, "rb") as fh:
+        text = fh.read(_HEAD_BYTES).decode("utf-8", "replace")
+        if "<title>" not in text.lower():
+            text += fh.read().decode("utf-8", "replace")
+
+    topic = extract_meta_comment(text, "TOPIC") or "Unsorted"
+    desc = extract_meta_comment(text, "DESC") or ""
+    title = extract_title(text) or label_from_filename(Path(name))
+    return key, [title, topic, desc]
+
+
+def collect_root_apps(cache: Dict[str, List[str]]) -> tuple[Dict[str, List[AppLink]], Dict[str, List[str]]]:
+    groups: Dict[str, List[AppLink]] = {}
+    new_cache: Dict[str, List[str]] = {}
+
+    entries = _scan_root_html()
+    cold = [e for e in entries if e[2] not in cache]
+
+    # Cache hits need no I/O at all; the cold files are read in threads —
+    # the reads overlap and the parsing is cheap.
+    if len(cold) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            new_cache.update(ex.map(_parse_one, cold))
+    elif cold:
+        new_cache.update([_parse_one(cold[0])])
+
+    for name, path, key in entries:
+        title, topic, desc = new_cache[key] if key in new_cache else cache[key]
+        # A handful of topics repeat across many files (and arrive as
+        # fresh strings from the JSON cache); interning dedupes them and
+        # keeps the group lookups identity-fast
+        topic = sys.intern(topic or "Unsorted")
+        new_cache[key] = [title, topic, desc]
+        groups.setdefault(topic, []).append(AppLink(href=name, title=title, topic=topic, desc=desc))
+
+    for t in groups:
+        groups[t].sort(key=operator.attrgetter("title_key"))
+
+    # ordered topics, with Unsorted last
+    ordered: Dict[str, List[AppLink]] = {}
+    for t in sorted([k for k in groups.keys() if k.lower() != "unsorted"], key=str.lower):
+        ordered[t] = groups[t]
+    if "Unsorted" in groups:
+        ordered["Unsorted"] = groups["Unsorted"]
+
+    return ordered, new_cache
+
+
+def first_existing_cover(book_path: str) -> Optional[str]:
+    """
+    Cover preference:
+      1) pages/001.webp (or any ext)
+      2) thumbs/001.webp (or any ext)
+
+    One scandir per folder replaces an exists() probe per extension.
+    Returns the cover as a book-relative href ('pages/001.webp'), ready
+    to drop into 'books/<name>/...' with no relpath round trip.
+    """
+    for sub in ("pages", "thumbs"):
+        try:
+            with os.scandir(os.path.join(book_path, sub)) as it:
+                names = {e.name for e in it}
+        except OSError:
+            continue
+        for ext in IMAGE_EXTS:
+            fn = "001" + ext
+            if fn in names:
+                return f"{sub}/{fn}"
+    return None
+
+
+def collect_books() -> List[BookTile]:
+    if not BOOKS_DIR.exists():
+        return []
+
+    # Tuples carry their case-folded key up front, so sort() needs no
+    # key callback at all
+    with os.scandir(BOOKS_DIR) as it:
+        books = [(e.name.lower(), e.name, e.path) for e in it if e.is_dir(follow_symlinks=False)]
+    books.sort()
+
+    tiles: List[BookTile] = []
+    for _, name, path in books:
+        if not os.path.isfile(os.path.join(path, "viewer.html")):
+            continue
+
+        cover = first_existing_cover(path)
+        if not cover:
+            # If no cover found, still list it (text-only tile fallback)
+            tiles.append(BookTile(viewer_href=f"books/{name}/viewer.html", cover_src="", name=name))
+            continue
+
+        tiles.append(
+            BookTile(
+                viewer_href=f"books/{name}/viewer.html",
+                cover_src=f"books/{name}/{cover}",
+                name=name,
+            )
+        )
+
+    return tiles
+
+
+def build_index_html(app_groups: Dict[str, List[AppLink]], books: List[BookTile]) -> str:
+    # Every fragment goes into one flat list joined once at the end — no
+    # per-section joins, no intermediate copies of half the page.
+    parts: List[str] = [_HEAD]
+
+    # Apps section
+    if app_groups:
+        parts.append("""<section class="section">
+  <div class="section-head">
+    <h1>Apps</h1>
+    <p class="muted">Drop any <code>.html</code> file into the site root and it appears here automatically.</p>
+  </div>
+  """)
+        for topic, apps in app_groups.items():
+            topic_esc = html.escape(topic)
+            parts.append(f"""<section class="block">
+  <div class="block-head">
+    <h2>{topic_esc}</h2>
+    <div class="count">{len(apps)} app{"s" if len(apps)!=1 else ""}</div>
+  </div>
+  <div class="grid">
+    """)
+            for a in apps:
+                desc_html = f"<p class='muted'>{a.desc_esc}</p>" if a.desc_esc else "<p class='muted'>&nbsp;</p>"
+                parts.append(f"""<a class="card" href="{a.href}">
+  <div class="card-title">{a.title_esc}</div>
+  {desc_html}
+  <div class="chip">{a.topic_esc}</div>
+</a>""")
+            parts.append("""
+  </div>
+</section>""")
+        parts.append("""
+</section>""")
+
+    parts.append("\n    ")
+
+    # Books section
+    if books:
+        parts.append("""<section class="section">
+  <div class="section-head">
+    <h1>Books</h1>
+    <p class="muted">Viewer pages are discovered in <code>books/&lt;book&gt;/viewer.html</code>.</p>
+  </div>
+  <div class="tiles">
+    """)
+        for b in books:
+            if b.cover_src:
+                parts.append(f"""<a href="{b.viewer_href}" class="tile" title="{b.name_esc}">
+  <img src="{b.cover_src}" alt="{b.name_esc}">
+  <div class="tile-label">{b.name_esc}</div>
+</a>""")
+            else:
+                # text-only fallback
+                parts.append(f"""<a href="{b.viewer_href}" class="tile tile-text" title="{b.name_esc}">
+  <div class="tile-label">{b.name_esc}</div>
+</a>""")
+        parts.append("""
+  </div>
+</section>""")
+
+    parts.append(_FOOTER)
+
+    return "".join(parts)
+
+
 def main() -> int:
-    app_groups = collect_root_apps()
+    cache = _load_cache()
+    app_groups, new_cache = collect_root_apps(cache)
     books = collect_books()
 
-    html = build_index_html(app_groups, books)
-    OUT.write_text(html, encoding="utf-8")
+    new = build_index_html(app_groups, books).encode("utf-8")
+
+    # Rewriting identical bytes would only churn the mtime (and anything
+    # watching it — editors, sync tools, git status)
+    try:
+        unchanged = OUT.read_bytes() == new
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        OUT.write_bytes(new)
+
+    if new_cache != cache:
+        CACHE_FILE.write_text(json.dumps(new_cache), encoding="utf-8")
 
     apps_count = sum(len(v) for v in app_groups.values())
-    print(f"✓ Built {OUT}")
+    print(f"✓ Unchanged {OUT}" if unchanged else f"✓ Built {OUT}")
     print(f"  Apps:  {apps_count} (topics: {len(app_groups)})")
     print(f"  Books: {len(books)}")
     return 0